@@ -9,12 +9,13 @@ from __future__ import annotations
 import logging.config
 import os
 from json import JSONDecodeError
-from typing import Any, Dict, List, Optional, Union, IO
+from typing import Any, Dict, List, Optional, Sequence, TypeVar, Union, IO
 
 from requests import Response, Session
 from requests.adapters import HTTPAdapter, Retry
 
-from dune_client.util import get_package_version
+from dune_client.models import BulkQueryError, DuneError
+from dune_client.util import get_package_version, json_dumps, json_loads, mypyc_attr
 
 # Headers used for pagination in CSV results
 DUNE_CSV_NEXT_URI_HEADER = "x-dune-next-uri"
@@ -22,8 +23,11 @@ DUNE_CSV_NEXT_OFFSET_HEADER = "x-dune-next-offset"
 # Default maximum number of rows to retrieve per batch of results
 MAX_NUM_ROWS_PER_BATCH = 32_000
 
+T = TypeVar("T")
+
 
 # pylint: disable=too-few-public-methods
+@mypyc_attr(allow_interpreted_subclasses=True)
 class BaseDuneClient:
     """
     A Base Client for Dune which sets up default values
@@ -52,10 +56,18 @@ class BaseDuneClient:
             allowed_methods={"GET", "POST", "PATCH"},
             raise_on_status=True,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # A single pooled session keeps connections alive across requests,
+        # so consecutive calls (e.g. execute_query followed by status polling)
+        # don't each pay for a new TCP + TLS handshake.
+        adapter = HTTPAdapter(
+            pool_connections=10, pool_maxsize=20, max_retries=retry_strategy
+        )
         self.http = Session()
         self.http.mount("https://", adapter)
         self.http.mount("http://", adapter)
+        # The API key is sent with each request (see `BaseRouter._request`),
+        # so that a later change of `self.token` takes effect.
+        self.http.headers["User-Agent"] = self.default_headers()["User-Agent"]
 
     @classmethod
     def from_env(cls) -> BaseDuneClient:
@@ -128,15 +140,57 @@ class BaseDuneClient:
 
         return params
 
+    @staticmethod
+    def _extract_query_id(response_json: Any, response_class: str) -> int:
+        """
+        Returns the `query_id` of a CRUD (query) endpoint response,
+        raising a DuneError (labelled `response_class`) when it is missing.
+        This is shared between the sync and async client.
+        """
+        try:
+            query_id = response_json["query_id"]
+        except KeyError as err:
+            raise DuneError(response_json, response_class, err) from err
+        # The API returns a JSON number (already decoded as int),
+        # so only convert when given something else (e.g. a string or bool).
+        # pylint: disable-next=unidiomatic-typecheck
+        return query_id if type(query_id) is int else int(query_id)
+
+    @staticmethod
+    def _collect_bulk_results(
+        query_ids: Sequence[int], outcomes: Sequence[Union[T, BaseException]]
+    ) -> Dict[int, T]:
+        """
+        Pairs each query id with the outcome of its request.
+        Returns the mapping when all succeeded and otherwise raises a
+        BulkQueryError carrying both the successful results and the errors.
+        This is shared between the sync and async client.
+        """
+        results: Dict[int, T] = {}
+        errors: Dict[int, BaseException] = {}
+        for query_id, outcome in zip(query_ids, outcomes):
+            if isinstance(outcome, BaseException):
+                errors[query_id] = outcome
+            else:
+                results[query_id] = outcome
+        if errors:
+            raise BulkQueryError(results, errors)
+        return results
+
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class BaseRouter(BaseDuneClient):
     """Extending the Base Client with elementary api routing"""
 
+    def close(self) -> None:
+        """Closes the underlying HTTP session and its pooled connections"""
+        self.http.close()
+
     def _handle_response(self, response: Response) -> Any:
         """Generic response handler utilized by all Dune API routes"""
         try:
             # Some responses can be decoded and converted to DuneErrors
-            response_json = response.json()
+            response_json = json_loads(response.content)
             self.logger.debug(f"received response {response_json}")
             return response_json
         except JSONDecodeError as err:
@@ -154,6 +208,39 @@ class BaseRouter(BaseDuneClient):
 
         return final_url
 
+    def _request(  # pylint: disable=too-many-arguments
+        self,
+        method: str,
+        url: str,
+        params: Optional[Any] = None,
+        json: Optional[Any] = None,
+        data: Optional[Union[IO[bytes], bytes]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        raw: bool = False,
+    ) -> Any:
+        """
+        Single dispatch point for all Dune API requests.
+        `params` are sent as the query string and `json` as the request body.
+        The body is serialized here (rather than via `requests`' `json=`)
+        so that the faster encoder from `json_dumps` is used.
+        As with `requests`, an explicit `data` payload takes precedence.
+        """
+        request_headers = {"x-dune-api-key": self.token, **(headers or {})}
+        if data is None and json is not None:
+            data = json_dumps(json)
+            request_headers.setdefault("Content-Type", "application/json")
+        response = self.http.request(
+            method,
+            url=url,
+            params=params,
+            data=data,
+            headers=request_headers,
+            timeout=self.request_timeout,
+        )
+        if raw:
+            return response
+        return self._handle_response(response)
+
     def _get(
         self,
         route: Optional[str] = None,
@@ -164,55 +251,28 @@ class BaseRouter(BaseDuneClient):
         """Generic interface for the GET method of a Dune API request"""
         final_url = self._route_url(route=route, url=url)
         self.logger.debug(f"GET received input url={final_url}")
-
-        response = self.http.get(
-            url=final_url,
-            headers=self.default_headers(),
-            timeout=self.request_timeout,
-            params=params,
-        )
-        if raw:
-            return response
-        return self._handle_response(response)
+        return self._request("GET", final_url, params=params, raw=raw)
 
     def _post(
         self,
         route: str,
         params: Optional[Any] = None,
-        data: Optional[IO[bytes]] = None,
+        data: Optional[Union[IO[bytes], bytes]] = None,
         headers: Optional[Dict[str, str]] = None,
     ) -> Any:
         """Generic interface for the POST method of a Dune API request"""
         url = self._route_url(route)
         self.logger.debug(f"POST received input url={url}, params={params}")
-        response = self.http.post(
-            url=url,
-            json=params,
-            headers=dict(self.default_headers(), **headers if headers else {}),
-            timeout=self.request_timeout,
-            data=data,
-        )
-        return self._handle_response(response)
+        return self._request("POST", url, json=params, data=data, headers=headers)
 
     def _patch(self, route: str, params: Any) -> Any:
         """Generic interface for the PATCH method of a Dune API request"""
         url = self._route_url(route)
         self.logger.debug(f"PATCH received input url={url}, params={params}")
-        response = self.http.patch(
-            url=url,
-            json=params,
-            headers=self.default_headers(),
-            timeout=self.request_timeout,
-        )
-        return self._handle_response(response)
+        return self._request("PATCH", url, json=params)
 
     def _delete(self, route: str) -> Any:
         """Generic interface for the DELETE method of a Dune API request"""
         url = self._route_url(route)
         self.logger.debug(f"DELETE received input url={url}")
-        response = self.http.delete(
-            url=url,
-            headers=self.default_headers(),
-            timeout=self.request_timeout,
-        )
-        return self._handle_response(response)
+        return self._request("DELETE", url)
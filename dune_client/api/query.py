@@ -6,30 +6,80 @@ and freeing you from UI-exclusive query editing.
 """
 
 from __future__ import annotations
-from typing import Optional, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Final, Iterable, Optional, Tuple, TypeVar
 
 from dune_client.api.base import BaseRouter
-from dune_client.models import DuneError
 from dune_client.query import DuneQuery
 from dune_client.types import QueryParameter
+from dune_client.util import TTLCache, mypyc_attr
 
+# Query metadata rarely changes within seconds, so `get_query` results
+# are reused for this long (unless modified through this client).
+QUERY_CACHE_TTL_SECONDS = 5.0
+QUERY_CACHE_MAX_SIZE = 512
+# Number of requests issued in parallel by the bulk_* methods.
+# Kept below the session's connection pool size, so connections are reused.
+BULK_MAX_WORKERS = 10
 
+T = TypeVar("T")
+
+# API field names of `update_query`, in the order its values are collected.
+_UPDATE_FIELDS: Final[Tuple[str, ...]] = (
+    "name",
+    "description",
+    "tags",
+    "query_sql",
+    "parameters",
+)
+# Transformations applied to `update_query` fields before they are sent.
+# Fields without an entry are sent as given.
+_UPDATE_TRANSFORM: Final[Dict[str, Callable[[Any], Any]]] = {
+    "parameters": lambda params: [p.to_dict() for p in params],
+}
+
+
+@mypyc_attr(allow_interpreted_subclasses=True)
 class QueryAPI(BaseRouter):
     """
     Implementation of Query API (aka CRUD) Operations - Plus subscription only
     https://docs.dune.com/api-reference/queries/endpoint/query-object
     """
 
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        api_key: str,
+        base_url: str = "https://api.dune.com",
+        request_timeout: float = 10,
+        client_version: str = "v1",
+        performance: str = "medium",
+    ):
+        super().__init__(
+            api_key=api_key,
+            base_url=base_url,
+            request_timeout=request_timeout,
+            client_version=client_version,
+            performance=performance,
+        )
+        self._query_cache: TTLCache[int, DuneQuery] = TTLCache(
+            maxsize=QUERY_CACHE_MAX_SIZE, ttl=QUERY_CACHE_TTL_SECONDS
+        )
+
     def create_query(
         self,
         name: str,
         query_sql: str,
         params: Optional[list[QueryParameter]] = None,
         is_private: bool = False,
+        verify: bool = False,
     ) -> DuneQuery:
         """
         Creates Dune Query by ID
         https://docs.dune.com/api-reference/queries/endpoint/create
+
+        The returned DuneQuery is built from the given inputs, so metadata only
+        known to Dune (e.g. owner, version, engine) is left empty.
+        Pass `verify=True` to fetch the stored query instead (an extra request).
         """
         payload = {
             "name": name,
@@ -39,20 +89,33 @@ class QueryAPI(BaseRouter):
         if params is not None:
             payload["parameters"] = [p.to_dict() for p in params]
         response_json = self._post(route="/query/", params=payload)
-        try:
-            query_id = int(response_json["query_id"])
-            # Note that this requires an extra request.
-            return self.get_query(query_id)
-        except KeyError as err:
-            raise DuneError(response_json, "CreateQueryResponse", err) from err
+        query_id = self._extract_query_id(response_json, "CreateQueryResponse")
+        if verify:
+            return self.get_query(query_id, fresh=True)
+        return DuneQuery.from_create_request(
+            query_id, name, query_sql, params, is_private
+        )
 
-    def get_query(self, query_id: int) -> DuneQuery:
+    def get_query(self, query_id: int, fresh: bool = False) -> DuneQuery:
         """
         Retrieves Dune Query by ID
         https://docs.dune.com/api-reference/queries/endpoint/read
+
+        Results are cached for a few seconds, so changes made elsewhere
+        (e.g. in the Dune UI) may not be visible until the cache entry expires;
+        pass `fresh=True` to bypass the cache.
+        Queries modified through this client are always re-fetched.
+        Every call returns its own copy, so modifying a result does not
+        affect later calls.
         """
+        if not fresh:
+            cached = self._query_cache.get(query_id)
+            if cached is not None:
+                return cached.copy()
         response_json = self._get(route=f"/query/{query_id}")
-        return DuneQuery.from_dict(response_json)
+        query = DuneQuery.from_dict(response_json)
+        self._query_cache.set(query_id, query.copy())
+        return query
 
     def update_query(  # pylint: disable=too-many-arguments
         self,
@@ -72,32 +135,24 @@ class QueryAPI(BaseRouter):
         If the tags or parameters are provided as an empty array,
         they will be deleted from the query.
         """
-        parameters: dict[str, Any] = {}
-        if name is not None:
-            parameters["name"] = name
-        if description is not None:
-            parameters["description"] = description
-        if tags is not None:
-            parameters["tags"] = tags
-        if query_sql is not None:
-            parameters["query_sql"] = query_sql
-        if params is not None:
-            parameters["parameters"] = [p.to_dict() for p in params]
-
-        if not bool(parameters):
+        proposed = (name, description, tags, query_sql, params)
+        if all(value is None for value in proposed):
             # Nothing to change no need to make reqeust
-            self.logger.warning("called update_query with no proposed changes.")
+            self.logger.debug("called update_query with no proposed changes.")
             return query_id
 
+        parameters: dict[str, Any] = {
+            key: _UPDATE_TRANSFORM[key](value) if key in _UPDATE_TRANSFORM else value
+            for key, value in zip(_UPDATE_FIELDS, proposed)
+            if value is not None
+        }
+
         response_json = self._patch(
             route=f"/query/{query_id}",
             params=parameters,
         )
-        try:
-            # No need to make a dataclass for this since it's just a boolean.
-            return int(response_json["query_id"])
-        except KeyError as err:
-            raise DuneError(response_json, "UpdateQueryResponse", err) from err
+        self._query_cache.pop(query_id)
+        return self._extract_query_id(response_json, "UpdateQueryResponse")
 
     def archive_query(self, query_id: int) -> bool:
         """
@@ -105,11 +160,11 @@ class QueryAPI(BaseRouter):
         returns resulting value of Query.is_archived
         """
         response_json = self._post(route=f"/query/{query_id}/archive")
-        try:
-            # No need to make a dataclass for this since it's just a boolean.
-            return self.get_query(int(response_json["query_id"])).meta.is_archived
-        except KeyError as err:
-            raise DuneError(response_json, "ArchiveQueryResponse", err) from err
+        self._query_cache.pop(query_id)
+        self._extract_query_id(response_json, "ArchiveQueryResponse")
+        # A successful archive request leaves the query archived,
+        # so there is no need to fetch it again.
+        return True
 
     def unarchive_query(self, query_id: int) -> bool:
         """
@@ -117,28 +172,65 @@ class QueryAPI(BaseRouter):
         returns resulting value of Query.is_archived
         """
         response_json = self._post(route=f"/query/{query_id}/unarchive")
-        try:
-            # No need to make a dataclass for this since it's just a boolean.
-            return self.get_query(int(response_json["query_id"])).meta.is_archived
-        except KeyError as err:
-            raise DuneError(response_json, "UnarchiveQueryResponse", err) from err
+        self._query_cache.pop(query_id)
+        self._extract_query_id(response_json, "UnarchiveQueryResponse")
+        # A successful unarchive request leaves the query unarchived.
+        return False
 
-    def make_private(self, query_id: int) -> None:
+    def make_private(self, query_id: int, verify: bool = False) -> None:
         """
         https://docs.dune.com/api-reference/queries/endpoint/private
+        A successful HTTP status already confirms the change;
+        pass `verify=True` to additionally re-fetch the query and check it.
         """
         response_json = self._post(route=f"/query/{query_id}/private")
-        try:
-            assert self.get_query(int(response_json["query_id"])).meta.is_private
-        except KeyError as err:
-            raise DuneError(response_json, "MakePrivateResponse", err) from err
+        self._query_cache.pop(query_id)
+        self._extract_query_id(response_json, "MakePrivateResponse")
+        if verify and not self.get_query(query_id, fresh=True).meta.is_private:
+            raise ValueError(f"query {query_id} is still public")
 
-    def make_public(self, query_id: int) -> None:
+    def make_public(self, query_id: int, verify: bool = False) -> None:
         """
         https://docs.dune.com/api-reference/queries/endpoint/unprivate
+        A successful HTTP status already confirms the change;
+        pass `verify=True` to additionally re-fetch the query and check it.
         """
         response_json = self._post(route=f"/query/{query_id}/unprivate")
-        try:
-            assert not self.get_query(int(response_json["query_id"])).meta.is_private
-        except KeyError as err:
-            raise DuneError(response_json, "MakePublicResponse", err) from err
+        self._query_cache.pop(query_id)
+        self._extract_query_id(response_json, "MakePublicResponse")
+        if verify and self.get_query(query_id, fresh=True).meta.is_private:
+            raise ValueError(f"query {query_id} is still private")
+
+    def bulk_archive(self, query_ids: Iterable[int]) -> dict[int, bool]:
+        """
+        Archives several queries concurrently (each query id at most once).
+        returns a mapping of query_id to resulting value of Query.is_archived
+
+        This is not atomic, see BulkQueryError.
+        """
+        return self._bulk(self.archive_query, query_ids)
+
+    def bulk_unarchive(self, query_ids: Iterable[int]) -> dict[int, bool]:
+        """
+        Unarchives several queries concurrently (each query id at most once).
+        returns a mapping of query_id to resulting value of Query.is_archived
+
+        This is not atomic, see BulkQueryError.
+        """
+        return self._bulk(self.unarchive_query, query_ids)
+
+    def _bulk(
+        self, method: Callable[[int], T], query_ids: Iterable[int]
+    ) -> dict[int, T]:
+        """
+        Applies `method` to every distinct query id using a thread pool
+        (sharing this client's pooled HTTP session).
+        """
+        ids = list(dict.fromkeys(query_ids))
+        with ThreadPoolExecutor(max_workers=BULK_MAX_WORKERS) as executor:
+            futures = [executor.submit(method, query_id) for query_id in ids]
+        outcomes: list[T | BaseException] = []
+        for future in futures:
+            error = future.exception()
+            outcomes.append(future.result() if error is None else error)
+        return self._collect_bulk_results(ids, outcomes)
@@ -4,6 +4,10 @@ Framework built on Dune's API Documentation
 https://docs.dune.com/api-reference/overview/introduction
 """
 
+from __future__ import annotations
+
+from typing import Any
+
 from dune_client.api.extensions import ExtendedAPI
 
 
@@ -27,3 +31,9 @@ class DuneClient(ExtendedAPI):
                 |--- QueryAPI(BaseRouter)
                 |       - Contains CRUD Operations on Queries
     """
+
+    def __enter__(self) -> DuneClient:
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
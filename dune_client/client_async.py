@@ -9,14 +9,14 @@ from __future__ import annotations
 import asyncio
 import ssl
 from io import BytesIO
-from typing import Any, Callable, Dict, List, Optional, Union
+from json import JSONDecodeError
+from typing import Any, Callable, Dict, List, Optional, TypedDict, Union
 
 import certifi
 from aiohttp import (
     ClientResponseError,
     ClientSession,
     ClientResponse,
-    ContentTypeError,
     TCPConnector,
     ClientTimeout,
 )
@@ -37,7 +37,9 @@ from dune_client.models import (
     ExecutionState,
 )
 
-from dune_client.query import QueryBase, parse_query_object_or_id
+from dune_client.query import DuneQuery, QueryBase, parse_query_object_or_id
+from dune_client.types import QueryParameter
+from dune_client.util import json_dumps, json_loads
 
 
 class RetryableError(Exception):
@@ -63,6 +65,21 @@ class MaxRetryError(Exception):
         super().__init__(message)
 
 
+class _CreateQuerySpecRequired(TypedDict):
+    name: str
+    query_sql: str
+
+
+class CreateQuerySpec(_CreateQuerySpecRequired, total=False):
+    """
+    Arguments of a single query created by `AsyncDuneClient.create_queries`
+    (the keyword arguments of `create_query`, except `verify`)
+    """
+
+    params: Optional[List[QueryParameter]]
+    is_private: bool
+
+
 # pylint: disable=duplicate-code
 class AsyncDuneClient(BaseDuneClient):
     """
@@ -121,10 +138,10 @@ class AsyncDuneClient(BaseDuneClient):
                 ) from err
         try:
             # Some responses can be decoded and converted to DuneErrors
-            response_json = await response.json()
+            response_json = json_loads(await response.read())
             self.logger.debug(f"received response {response_json}")
             return response_json
-        except ContentTypeError as err:
+        except JSONDecodeError as err:
             # Others can't. Only raise HTTP error for not decodable errors
             response.raise_for_status()
             raise ValueError("Unreachable since previous line raises") from err
@@ -189,14 +206,21 @@ class AsyncDuneClient(BaseDuneClient):
     async def _post(self, route: str, params: Any) -> Any:
         url = self._route_url(route)
         self.logger.debug(f"POST received input url={url}, params={params}")
+        # Serialize once up front (rather than via aiohttp's `json=`),
+        # so retries reuse the body and the faster encoder is used.
+        headers = self.default_headers()
+        body: Optional[bytes] = None
+        if params is not None:
+            body = json_dumps(params)
+            headers["Content-Type"] = "application/json"
 
         async def _post() -> Any:
             if self._session is None:
                 raise ValueError("Client is not connected; call `await cl.connect()`")
             response = await self._session.post(
                 url=url,
-                json=params,
-                headers=self.default_headers(),
+                data=body,
+                headers=headers,
             )
             return await self._handle_response(response)
 
@@ -349,10 +373,112 @@ class AsyncDuneClient(BaseDuneClient):
         except KeyError as err:
             raise DuneError(response_json, "CancellationResponse", err) from err
 
+    async def create_query(
+        self,
+        name: str,
+        query_sql: str,
+        params: Optional[List[QueryParameter]] = None,
+        is_private: bool = False,
+        verify: bool = False,
+    ) -> DuneQuery:
+        """
+        Creates Dune Query by ID
+        https://docs.dune.com/api-reference/queries/endpoint/create
+
+        As with the sync client, the returned DuneQuery is built from the inputs
+        unless `verify=True`, in which case the stored query is fetched.
+        """
+        payload: Dict[str, Any] = {
+            "name": name,
+            "query_sql": query_sql,
+            "is_private": is_private,
+        }
+        if params is not None:
+            payload["parameters"] = [p.to_dict() for p in params]
+        response_json = await self._post(route="/query/", params=payload)
+        query_id = self._extract_query_id(response_json, "CreateQueryResponse")
+        if verify:
+            return await self.get_query(query_id)
+        return DuneQuery.from_create_request(
+            query_id, name, query_sql, params, is_private
+        )
+
+    async def get_query(self, query_id: int) -> DuneQuery:
+        """
+        Retrieves Dune Query by ID
+        https://docs.dune.com/api-reference/queries/endpoint/read
+        """
+        response_json = await self._get(route=f"/query/{query_id}")
+        return DuneQuery.from_dict(response_json)
+
+    async def archive_query(self, query_id: int) -> bool:
+        """
+        https://docs.dune.com/api-reference/queries/endpoint/archive
+        returns resulting value of Query.is_archived
+        """
+        response_json = await self._post(
+            route=f"/query/{query_id}/archive", params=None
+        )
+        self._extract_query_id(response_json, "ArchiveQueryResponse")
+        return True
+
+    async def unarchive_query(self, query_id: int) -> bool:
+        """
+        https://docs.dune.com/api-reference/queries/endpoint/unarchive
+        returns resulting value of Query.is_archived
+        """
+        response_json = await self._post(
+            route=f"/query/{query_id}/unarchive", params=None
+        )
+        self._extract_query_id(response_json, "UnarchiveQueryResponse")
+        return False
+
     ########################
     # Higher level functions
     ########################
 
+    async def bulk_archive(self, query_ids: List[int]) -> Dict[int, bool]:
+        """
+        Archives several queries concurrently (each query id at most once).
+        returns a mapping of query_id to resulting value of Query.is_archived
+
+        This is not atomic, see BulkQueryError.
+        """
+        ids = list(dict.fromkeys(query_ids))
+        outcomes = await asyncio.gather(
+            *[self.archive_query(i) for i in ids], return_exceptions=True
+        )
+        return self._collect_bulk_results(ids, outcomes)
+
+    async def bulk_unarchive(self, query_ids: List[int]) -> Dict[int, bool]:
+        """
+        Unarchives several queries concurrently (each query id at most once).
+        returns a mapping of query_id to resulting value of Query.is_archived
+
+        This is not atomic, see BulkQueryError.
+        """
+        ids = list(dict.fromkeys(query_ids))
+        outcomes = await asyncio.gather(
+            *[self.unarchive_query(i) for i in ids], return_exceptions=True
+        )
+        return self._collect_bulk_results(ids, outcomes)
+
+    async def create_queries(
+        self, specs: List[CreateQuerySpec], verify: bool = False
+    ) -> List[DuneQuery]:
+        """
+        Creates several queries concurrently, returning them in the order given.
+        `verify` applies to all of them, so specs must not contain it.
+        Concurrency is bounded by the client's `connection_limit`.
+        """
+        if any("verify" in spec for spec in specs):
+            raise ValueError("pass `verify` to create_queries, not in the specs")
+        return list(
+            await asyncio.gather(
+                *[self.create_query(**spec, verify=verify) for spec in specs]
+            )
+        )
+
     async def refresh(
         self,
         query: QueryBase,
@@ -26,6 +26,23 @@ class QueryFailed(Exception):
     """Special Error for failed Queries"""
 
 
+class BulkQueryError(Exception):
+    """
+    Raised by the bulk query operations (e.g. `bulk_archive`) when some requests fail.
+    These operations are not atomic: the requests for all other queries were still sent,
+    and this error is only raised once all of them are done.
+    `results` holds their outcome and `errors` the exception raised per failed query_id.
+    """
+
+    def __init__(self, results: dict[int, Any], errors: dict[int, BaseException]):
+        self.results = results
+        self.errors = errors
+        super().__init__(
+            f"{len(errors)} of {len(results) + len(errors)} bulk requests failed "
+            f"for query ids {sorted(errors)}"
+        )
+
+
 class DuneError(Exception):
     """Possibilities seen so far
     {'error': 'invalid API Key'}
@@ -4,7 +4,7 @@ Data Classes Representing a Dune Query
 
 from __future__ import annotations
 import urllib.parse
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Optional, List, Dict, Union, Any
 
 from dune_client.types import QueryParameter
@@ -116,3 +116,53 @@ class DuneQuery:
             ),
             sql=data["query_sql"],
         )
+
+    def copy(self) -> DuneQuery:
+        """
+        Returns a copy sharing no mutable state (parameters, tags)
+        with this query, so that either can be modified independently.
+        """
+        params = self.base.params
+        return DuneQuery(
+            base=replace(
+                self.base,
+                params=(
+                    None
+                    if params is None
+                    else [QueryParameter(p.key, p.type, p.value) for p in params]
+                ),
+            ),
+            meta=replace(self.meta, tags=list(self.meta.tags)),
+            sql=self.sql,
+        )
+
+    @classmethod
+    def from_create_request(  # pylint: disable=too-many-arguments
+        cls,
+        query_id: int,
+        name: str,
+        query_sql: str,
+        params: Optional[List[QueryParameter]] = None,
+        is_private: bool = False,
+    ) -> DuneQuery:
+        """
+        Constructs the query resulting from a successful create request
+        without fetching it. Metadata only known to Dune (e.g. owner, version,
+        engine) is left empty.
+        """
+        return cls(
+            base=QueryBase(
+                query_id=query_id, name=name, params=list(params) if params else []
+            ),
+            meta=QueryMeta(
+                description="",
+                tags=[],
+                version=1,
+                engine="",
+                is_private=is_private,
+                is_archived=False,
+                is_unsaved=False,
+                owner="",
+            ),
+            sql=query_sql,
+        )
@@ -9,14 +9,15 @@ from __future__ import annotations
 import re
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Tuple
 
-from dune_client.util import postgres_date
+from dune_client.util import mypyc_attr, postgres_date
 
 DuneRecord = Dict[str, Any]
 
 
 # pylint: disable=too-few-public-methods
+@mypyc_attr(allow_interpreted_subclasses=True)
 class Address:
     """
     Class representing Ethereum Address as a hexadecimal string of length 42.
@@ -101,6 +102,7 @@ class ParameterType(Enum):
         raise ValueError(f"could not parse Network from '{type_str}'")
 
 
+@mypyc_attr(allow_interpreted_subclasses=True)
 class QueryParameter:
     """Class whose instances are Dune Compatible Query Parameters"""
 
@@ -113,6 +115,10 @@ class QueryParameter:
         self.key: str = name
         self.type: ParameterType = parameter_type
         self.value = value
+        # (key, type, value, dict form) as of the last call to `to_dict`
+        self._dict_cache: Optional[Tuple[str, ParameterType, Any, dict[str, str]]] = (
+            None
+        )
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, QueryParameter):
@@ -160,13 +166,26 @@ class QueryParameter:
         raise TypeError(f"Type {self.type} not recognized!")
 
     def to_dict(self) -> dict[str, str]:
-        """Converts QueryParameter into string json format accepted by Dune API"""
-        results: dict[str, str] = {
-            "key": self.key,
-            "type": self.type.value,
-            "value": self.value_str(),
-        }
-        return results
+        """
+        Converts QueryParameter into string json format accepted by Dune API.
+        The result is computed once per parameter value and a copy is returned,
+        so repeatedly sending the same parameters doesn't re-serialize them.
+        """
+        cache = self._dict_cache
+        if (
+            cache is None
+            or cache[0] is not self.key
+            or cache[1] is not self.type
+            or cache[2] is not self.value
+        ):
+            results: dict[str, str] = {
+                "key": self.key,
+                "type": self.type.value,
+                "value": self.value_str(),
+            }
+            cache = (self.key, self.type, self.value, results)
+            self._dict_cache = cache
+        return dict(cache[3])
 
     @classmethod
     def from_dict(cls, obj: dict[str, Any]) -> QueryParameter:
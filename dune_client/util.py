@@ -2,10 +2,48 @@
 
 from datetime import datetime, timezone
 import importlib
-from typing import Optional
+import json
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+# `mypyc_attr` only matters for the optional compiled build (cf. setup.py),
+# so mypy-extensions is not required at runtime.
+if TYPE_CHECKING:
+    # The alias marks an explicit re-export for mypy.
+    from mypy_extensions import (  # pylint: disable=useless-import-alias
+        mypyc_attr as mypyc_attr,
+    )
+else:
+    try:
+        from mypy_extensions import mypyc_attr
+    except ImportError:  # pragma: no cover
+
+        def mypyc_attr(*_attrs: str, **_kwattrs: object) -> Callable[[Any], Any]:
+            """No-op stand-in for `mypy_extensions.mypyc_attr`"""
+            return lambda obj: obj
+
 
 DUNE_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
 
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
 
 def postgres_date(date_str: str) -> datetime:
     """Parse a postgres compatible date string into datetime object"""
@@ -29,3 +67,76 @@ def age_in_hours(timestamp: datetime) -> float:
     """
     result_age = datetime.now(timezone.utc) - timestamp
     return result_age.total_seconds() / (60 * 60)
+
+
+def json_loads(data: bytes) -> Any:
+    """
+    Decodes a raw (UTF-8 encoded) JSON payload.
+    Uses orjson when installed and falls back to the standard library otherwise.
+    Raises (a subclass of) `json.JSONDecodeError` on invalid input,
+    including payloads that aren't valid UTF-8 (e.g. non-JSON error pages).
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    try:
+        return json.loads(data)
+    except UnicodeDecodeError as err:
+        raise json.JSONDecodeError(str(err), "", 0) from err
+
+
+def json_dumps(obj: Any) -> bytes:
+    """
+    Encodes `obj` as a compact UTF-8 JSON payload (suitable as a request body).
+    Uses orjson when installed and falls back to the standard library otherwise.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+class TTLCache(Generic[KeyT, ValueT]):
+    """
+    A small thread-safe in-memory cache whose entries expire `ttl` seconds
+    after they were stored. Once `maxsize` entries are held,
+    the oldest entry is evicted to make room for a new one.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: Dict[KeyT, Tuple[float, ValueT]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: KeyT) -> Optional[ValueT]:
+        """Returns the value stored under `key`, or None if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+            return value
+
+    def set(self, key: KeyT, value: ValueT) -> None:
+        """Stores `value` under `key`, evicting the oldest entry when full"""
+        with self._lock:
+            self._data.pop(key, None)
+            if len(self._data) >= self.maxsize:
+                del self._data[next(iter(self._data))]
+            self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def pop(self, key: KeyT) -> None:
+        """Removes `key` from the cache (if present)"""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Removes all entries from the cache"""
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
@@ -1,4 +1,20 @@
+import os
+
 import setuptools
 
+# Opt-in compiled build: DUNE_CLIENT_COMPILE=1 compiles the modules below
+# with mypyc (requires mypy in the build environment).
+# By default, a pure-Python distribution is built.
+COMPILED_MODULES = [
+    "dune_client/api/base.py",
+    "dune_client/api/query.py",
+    "dune_client/types.py",
+]
+
 if __name__ == "__main__":
-    setuptools.setup()
+    ext_modules = []
+    if os.environ.get("DUNE_CLIENT_COMPILE") == "1":
+        from mypyc.build import mypycify
+
+        ext_modules = mypycify(COMPILED_MODULES, opt_level="3")
+    setuptools.setup(ext_modules=ext_modules)
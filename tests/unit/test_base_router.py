@@ -0,0 +1,100 @@
+import unittest
+from unittest import mock
+
+import aiounittest
+from aiohttp import ClientResponseError
+from requests import HTTPError
+
+from dune_client.client import DuneClient
+from dune_client.client_async import AsyncDuneClient
+
+
+class TestDuneClient(unittest.TestCase):
+    def test_session_headers(self):
+        client = DuneClient("fake-key")
+        self.assertNotIn("x-dune-api-key", client.http.headers)
+        self.assertIn("dune-client/", client.http.headers["User-Agent"])
+        client.close()
+
+    def test_api_key_sent_per_request(self):
+        client = DuneClient("fake-key")
+        response = mock.Mock(content=b"{}")
+        with mock.patch.object(
+            client.http, "request", return_value=response
+        ) as request:
+            client._get(route="/query/1")
+            client.token = "new-key"
+            client._get(route="/query/1")
+        self.assertEqual(
+            [
+                call.kwargs["headers"]["x-dune-api-key"]
+                for call in request.call_args_list
+            ],
+            ["fake-key", "new-key"],
+        )
+        client.close()
+
+    def test_context_manager_closes_session(self):
+        client = DuneClient("fake-key")
+        with mock.patch.object(client.http, "close") as close:
+            with client as entered:
+                self.assertIs(entered, client)
+                close.assert_not_called()
+            close.assert_called_once()
+
+    def test_json_body_serialized_once(self):
+        client = DuneClient("fake-key")
+        response = mock.Mock(content=b'{"query_id": 1}')
+        with mock.patch.object(
+            client.http, "request", return_value=response
+        ) as request:
+            self.assertEqual(
+                client._post(route="/query/", params={"name": "x"}), {"query_id": 1}
+            )
+        request.assert_called_once_with(
+            "POST",
+            url="https://api.dune.com/api/v1/query/",
+            params=None,
+            data=b'{"name":"x"}',
+            headers={
+                "x-dune-api-key": "fake-key",
+                "Content-Type": "application/json",
+            },
+            timeout=client.request_timeout,
+        )
+        client.close()
+
+    def test_undecodable_response_raises_http_error(self):
+        client = DuneClient("fake-key")
+        response = mock.Mock(content=b"<html>Bad Gateway caf\xe9</html>")
+        response.raise_for_status.side_effect = HTTPError("502 Server Error")
+        with mock.patch("dune_client.util.orjson", None):
+            with self.assertRaises(HTTPError):
+                client._handle_response(response)
+        client.close()
+
+
+class TestAsyncDuneClient(aiounittest.AsyncTestCase):
+    async def test_handle_response_decodes_raw_body(self):
+        client = AsyncDuneClient("fake-key")
+        response = mock.Mock(status=200)
+        response.read = mock.AsyncMock(return_value=b'{"query_id": 1}')
+        self.assertEqual(await client._handle_response(response), {"query_id": 1})
+
+    async def test_undecodable_response_raises_http_error(self):
+        client = AsyncDuneClient("fake-key")
+        response = mock.Mock(status=404)
+        response.read = mock.AsyncMock(return_value=b"<html>caf\xe9</html>")
+        response.raise_for_status.side_effect = ClientResponseError(
+            mock.Mock(), (), status=404
+        )
+        with self.assertRaises(ClientResponseError):
+            await client._handle_response(response)
+        # Also without orjson (standard library fallback).
+        with mock.patch("dune_client.util.orjson", None):
+            with self.assertRaises(ClientResponseError):
+                await client._handle_response(response)
+
+
+if __name__ == "__main__":
+    unittest.main()
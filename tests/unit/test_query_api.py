@@ -0,0 +1,273 @@
+import unittest
+from unittest import mock
+
+import aiounittest
+
+from dune_client.client import DuneClient
+from dune_client.client_async import AsyncDuneClient
+from dune_client.models import BulkQueryError, DuneError
+from dune_client.types import QueryParameter
+
+
+def call_arguments(call):
+    """Arguments of a `_post`/`_patch` call, regardless of how they were passed"""
+    args, kwargs = call
+    return {**dict(zip(("route", "params"), args)), **kwargs}
+
+
+class TestQueryAPI(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = DuneClient("fake-key")
+        self.query_id = 1234
+
+    def tearDown(self) -> None:
+        self.client.close()
+
+    def query_json(self, is_private: bool) -> dict:
+        return {
+            "query_id": self.query_id,
+            "name": "test",
+            "description": "",
+            "tags": [],
+            "version": 1,
+            "parameters": [{"key": "N", "type": "number", "value": "10"}],
+            "query_engine": "v2 Dune SQL",
+            "query_sql": "select 1",
+            "is_private": is_private,
+            "is_archived": False,
+            "is_unsaved": False,
+            "owner": "owner",
+        }
+
+    def test_get_query_cached(self):
+        with mock.patch.object(
+            self.client, "_get", return_value=self.query_json(False)
+        ) as get:
+            query = self.client.get_query(self.query_id)
+            self.assertEqual(self.client.get_query(self.query_id), query)
+            self.assertEqual(get.call_count, 1)
+            # Modifying a result doesn't leak into the cache.
+            query.sql = "mutated"
+            query.meta.tags.append("tag")
+            query.base.parameters()[0].value = 11
+            cached = self.client.get_query(self.query_id)
+            self.assertEqual(get.call_count, 1)
+            self.assertEqual(cached.sql, "select 1")
+            self.assertEqual(cached.meta.tags, [])
+            self.assertEqual(cached.base.parameters()[0].value, 10)
+            self.client.get_query(self.query_id, fresh=True)
+            self.assertEqual(get.call_count, 2)
+
+    def test_get_query_invalidated_on_change(self):
+        with mock.patch.object(
+            self.client,
+            "_get",
+            side_effect=[self.query_json(False), self.query_json(True)],
+        ), mock.patch.object(
+            self.client, "_post", return_value={"query_id": self.query_id}
+        ):
+            self.assertFalse(self.client.get_query(self.query_id).meta.is_private)
+            self.client.make_private(self.query_id)
+            self.assertTrue(self.client.get_query(self.query_id).meta.is_private)
+
+    def test_get_query_fresh_ignores_mutations(self):
+        # Each GET returns a newly decoded (but identical) body.
+        with mock.patch.object(
+            self.client,
+            "_get",
+            side_effect=lambda *args, **kwargs: self.query_json(False),
+        ) as get:
+            query = self.client.get_query(self.query_id)
+            query.sql = "mutated"
+            query.base.parameters().append(QueryParameter.text_type("Text", "x"))
+            fresh = self.client.get_query(self.query_id, fresh=True)
+        self.assertEqual(get.call_count, 2)
+        self.assertEqual(fresh.sql, "select 1")
+        self.assertEqual(fresh.base.parameters(), [QueryParameter.number_type("N", 10)])
+
+    def test_create_query_single_request(self):
+        params = [QueryParameter.text_type("Text", "plain text")]
+        with mock.patch.object(
+            self.client, "_post", return_value={"query_id": self.query_id}
+        ) as post, mock.patch.object(self.client, "_get") as get:
+            query = self.client.create_query(
+                name="test", query_sql="select 1", params=params, is_private=True
+            )
+        post.assert_called_once()
+        self.assertEqual(
+            call_arguments(post.call_args),
+            {
+                "route": "/query/",
+                "params": {
+                    "name": "test",
+                    "query_sql": "select 1",
+                    "is_private": True,
+                    "parameters": [
+                        {"key": "Text", "type": "text", "value": "plain text"}
+                    ],
+                },
+            },
+        )
+        get.assert_not_called()
+        self.assertEqual(query.base.query_id, self.query_id)
+        self.assertEqual(query.base.params, params)
+        self.assertEqual(query.sql, "select 1")
+        self.assertTrue(query.meta.is_private)
+        # The query doesn't share the caller's list.
+        params.clear()
+        self.assertEqual(len(query.base.parameters()), 1)
+
+    def test_archive_and_unarchive_single_request(self):
+        response = {"query_id": self.query_id}
+        with mock.patch.object(
+            self.client, "_post", return_value=response
+        ) as post, mock.patch.object(self.client, "_get") as get:
+            self.assertTrue(self.client.archive_query(self.query_id))
+            self.assertFalse(self.client.unarchive_query(self.query_id))
+            self.client.make_private(self.query_id)
+            self.client.make_public(self.query_id)
+        self.assertEqual(post.call_count, 4)
+        get.assert_not_called()
+
+    def test_update_query_sends_only_given_fields(self):
+        params = [QueryParameter.number_type("Number", 12)]
+        with mock.patch.object(
+            self.client, "_patch", return_value={"query_id": self.query_id}
+        ) as patch:
+            result = self.client.update_query(
+                self.query_id, query_sql="select 2", params=params, tags=[]
+            )
+        self.assertEqual(result, self.query_id)
+        patch.assert_called_once()
+        self.assertEqual(
+            call_arguments(patch.call_args),
+            {
+                "route": f"/query/{self.query_id}",
+                "params": {
+                    "tags": [],
+                    "query_sql": "select 2",
+                    "parameters": [{"key": "Number", "type": "number", "value": "12"}],
+                },
+            },
+        )
+
+    def test_update_query_string_query_id(self):
+        with mock.patch.object(
+            self.client, "_patch", return_value={"query_id": str(self.query_id)}
+        ):
+            result = self.client.update_query(self.query_id, name="renamed")
+        self.assertEqual(result, self.query_id)
+        self.assertIsInstance(result, int)
+
+    def test_update_query_bool_query_id(self):
+        with mock.patch.object(self.client, "_patch", return_value={"query_id": True}):
+            result = self.client.update_query(self.query_id, name="renamed")
+        self.assertIs(type(result), int)
+        self.assertEqual(result, 1)
+
+    def test_update_query_without_changes(self):
+        with mock.patch.object(self.client, "_patch") as patch:
+            self.assertEqual(self.client.update_query(self.query_id), self.query_id)
+        patch.assert_not_called()
+
+    def test_make_private_error_response(self):
+        with mock.patch.object(
+            self.client, "_post", return_value={"error": "Query not found"}
+        ):
+            with self.assertRaises(DuneError):
+                self.client.make_private(self.query_id)
+
+    def test_make_private_verify(self):
+        with mock.patch.object(
+            self.client, "_post", return_value={"query_id": self.query_id}
+        ), mock.patch.object(
+            self.client, "_get", return_value=self.query_json(False)
+        ) as get:
+            with self.assertRaises(ValueError):
+                self.client.make_private(self.query_id, verify=True)
+            self.client.make_public(self.query_id, verify=True)
+        self.assertEqual(get.call_count, 2)
+
+    def test_bulk_archive(self):
+        with mock.patch.object(
+            self.client, "_post", side_effect=lambda route: {"query_id": 1}
+        ) as post:
+            self.assertEqual(
+                self.client.bulk_archive([1, 2, 3]), {1: True, 2: True, 3: True}
+            )
+            self.assertEqual(self.client.bulk_unarchive([4]), {4: False})
+        self.assertEqual(
+            sorted(call_arguments(call)["route"] for call in post.call_args_list),
+            [
+                "/query/1/archive",
+                "/query/2/archive",
+                "/query/3/archive",
+                "/query/4/unarchive",
+            ],
+        )
+
+    def test_bulk_archive_partial_failure(self):
+        def post(route):
+            if route == "/query/2/archive":
+                return {"error": "Query not found"}
+            return {"query_id": 1}
+
+        with mock.patch.object(self.client, "_post", side_effect=post) as mocked:
+            with self.assertRaises(BulkQueryError) as err:
+                self.client.bulk_archive([1, 2, 3, 1])
+        # Duplicates are only requested once.
+        self.assertEqual(mocked.call_count, 3)
+        self.assertEqual(err.exception.results, {1: True, 3: True})
+        self.assertEqual(list(err.exception.errors), [2])
+        self.assertIsInstance(err.exception.errors[2], DuneError)
+
+
+class TestAsyncQueryAPI(aiounittest.AsyncTestCase):
+    async def test_create_queries(self):
+        client = AsyncDuneClient("fake-key")
+        responses = [{"query_id": 1}, {"query_id": 2}]
+        with mock.patch.object(
+            client, "_post", mock.AsyncMock(side_effect=responses)
+        ) as post, mock.patch.object(client, "_get") as get:
+            queries = await client.create_queries(
+                [
+                    {"name": "first", "query_sql": "select 1"},
+                    {"name": "second", "query_sql": "select 2", "is_private": True},
+                ]
+            )
+        self.assertEqual(post.await_count, 2)
+        get.assert_not_called()
+        self.assertEqual([q.base.query_id for q in queries], [1, 2])
+        self.assertEqual([q.base.name for q in queries], ["first", "second"])
+        self.assertEqual([q.meta.is_private for q in queries], [False, True])
+
+    async def test_create_queries_rejects_verify_in_spec(self):
+        client = AsyncDuneClient("fake-key")
+        with mock.patch.object(client, "_post", mock.AsyncMock()) as post:
+            with self.assertRaises(ValueError):
+                await client.create_queries(
+                    [{"name": "first", "query_sql": "select 1", "verify": True}]
+                )
+        post.assert_not_awaited()
+
+    async def test_bulk_archive(self):
+        client = AsyncDuneClient("fake-key")
+        with mock.patch.object(
+            client, "_post", mock.AsyncMock(return_value={"query_id": 1})
+        ) as post:
+            self.assertEqual(await client.bulk_archive([1, 2]), {1: True, 2: True})
+            self.assertEqual(await client.bulk_unarchive([3]), {3: False})
+        self.assertEqual(post.await_count, 3)
+
+    async def test_bulk_archive_partial_failure(self):
+        client = AsyncDuneClient("fake-key")
+        responses = [{"query_id": 1}, {"error": "Query not found"}]
+        with mock.patch.object(client, "_post", mock.AsyncMock(side_effect=responses)):
+            with self.assertRaises(BulkQueryError) as err:
+                await client.bulk_unarchive([1, 2, 2])
+        self.assertEqual(err.exception.results, {1: False})
+        self.assertEqual(list(err.exception.errors), [2])
+
+
+if __name__ == "__main__":
+    unittest.main()
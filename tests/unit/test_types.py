@@ -68,6 +68,15 @@ class TestQueryParameter(unittest.TestCase):
             {"key": "Date", "type": "datetime", "value": "2022-03-10 00:00:00"},
         )
 
+    def test_to_dict_reflects_updates(self):
+        self.assertEqual(self.number_type.to_dict()["value"], "1")
+        # Mutating the returned dict doesn't affect the parameter.
+        self.number_type.to_dict()["value"] = "2"
+        self.assertEqual(self.number_type.to_dict()["value"], "1")
+        # Updating the parameter does.
+        self.number_type.value = 3
+        self.assertEqual(self.number_type.to_dict()["value"], "3")
+
     def test_repr_method(self):
         query = QueryBase(
             query_id=1,
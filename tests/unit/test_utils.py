@@ -1,6 +1,14 @@
 import datetime
+import json
 import unittest
-from dune_client.util import get_package_version, age_in_hours
+from unittest import mock
+from dune_client.util import (
+    TTLCache,
+    age_in_hours,
+    get_package_version,
+    json_dumps,
+    json_loads,
+)
 
 
 class TestUtils(unittest.TestCase):
@@ -18,3 +26,47 @@ class TestUtils(unittest.TestCase):
             1985, 3, 10, tzinfo=datetime.timezone.utc
         )
         self.assertGreaterEqual(age_in_hours(march_ten_eighty_five), 314159)
+
+    def test_json_round_trip(self):
+        payload = {
+            "name": "Query Name",
+            "query_sql": "select 1 -- ünïcödé",
+            "is_private": False,
+            "parameters": [{"key": "x", "type": "number", "value": "1"}],
+        }
+        encoded = json_dumps(payload)
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(json_loads(encoded), payload)
+
+    def test_json_without_orjson(self):
+        payload = {"query_id": 1, "name": "ünïcödé"}
+        with mock.patch("dune_client.util.orjson", None):
+            self.assertEqual(json_loads(json_dumps(payload)), payload)
+            with self.assertRaises(json.JSONDecodeError):
+                json_loads(b"<html>caf\xe9</html>")
+            with self.assertRaises(json.JSONDecodeError):
+                json_loads(b"not json")
+
+    def test_json_loads_invalid_utf8(self):
+        with self.assertRaises(json.JSONDecodeError):
+            json_loads(b"<html>caf\xe9</html>")
+
+    def test_ttl_cache_expiry(self):
+        cache = TTLCache(maxsize=2, ttl=5)
+        with mock.patch("dune_client.util.time.monotonic", return_value=100):
+            cache.set("a", 1)
+            self.assertEqual(cache.get("a"), 1)
+        with mock.patch("dune_client.util.time.monotonic", return_value=105):
+            self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+
+    def test_ttl_cache_eviction(self):
+        cache = TTLCache(maxsize=2, ttl=5)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), 2)
+        cache.pop("b")
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)